@@ -1,4 +1,4 @@
-from models import Phone, Record, AddressBook
+from models import Record, AddressBook, format_date, format_phone
 from utils import input_error
 
 
@@ -12,23 +12,19 @@ def add_contact(args, book: AddressBook):
     if len(args) != 2:
         raise ValueError("Provide exactly two arguments: name and phone.")
     name, phone = args
-    try:
-        # Validate phone format
-        phone_obj = Phone(phone)
-    except ValueError as e:
-        raise ValueError(str(e))
 
     try:
         # Try to find existing contact
         record = book.find(name)
-        record.add_phone(phone_obj.value)
-        return "Phone added to existing contact."
     except KeyError:
-        # Create new contact if not found
+        # Create new contact if not found; add_phone validates the format
+        # before the record is stored
         record = Record(name)
-        record.add_phone(phone_obj.value)
+        record.add_phone(phone)
         book.add_record(record)
         return "Contact added."
+    record.add_phone(phone)
+    return "Phone added to existing contact."
 
 
 @input_error
@@ -71,7 +67,7 @@ def show_phone(args, book: AddressBook):
     record = book.find(name)
     if not record.phones:
         return f"No phone numbers found for contact '{name}'."
-    phones = ", ".join(p.value for p in record.phones)
+    phones = ", ".join(map(format_phone, record.phones))
     return f"Phone numbers for '{name}': {phones}"
 
 
@@ -116,7 +112,7 @@ def show_birthday(args, book: AddressBook):
         raise IndexError("Please enter a name.")
     record = book.find(args[0])
     return (
-        record.birthday.value.strftime("%d.%m.%Y")
+        format_date(record.birthday.value)
         if record and record.birthday
         else "No birthday found."
     )
@@ -13,6 +13,20 @@ from handlers import (
 from utils import parse_input
 
 
+# Maps a command to its handler and whether the handler takes arguments.
+COMMANDS = {
+    "hello": (lambda book: "How can I help you?", False),
+    "add": (add_contact, True),
+    "change": (change_contact, True),
+    "delete": (remove_contact, True),
+    "phone": (show_phone, True),
+    "all": (show_all, False),
+    "add-birthday": (add_birthday, True),
+    "show-birthday": (show_birthday, True),
+    "birthdays": (birthdays, False),
+}
+
+
 def main():
     book = load_data()
     print("Welcome to the assistant bot!")
@@ -24,24 +38,11 @@ def main():
             print("Good bye!")
             save_data(book)
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command == "change":
-            print(change_contact(args, book))
-        elif command == "delete":
-            print(remove_contact(args, book))
-        elif command == "phone":
-            print(show_phone(args, book))
-        elif command == "all":
-            print(show_all(book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        elif command == "birthdays":
-            print(birthdays(book))
+
+        entry = COMMANDS.get(command)
+        if entry:
+            handler, takes_args = entry
+            print(handler(args, book) if takes_args else handler(book))
         else:
             print("Invalid command.")
 
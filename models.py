@@ -1,5 +1,7 @@
 from collections import UserDict
-from datetime import datetime
+from copy import copy
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 
 class Field:
@@ -7,9 +9,22 @@ class Field:
     Base class for record fields.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __setstate__(self, state):
+        """
+        Restores slot values from pickled state. Fields pickled before
+        __slots__ was introduced carry a plain attribute dict instead of
+        the (dict, slots) pair produced now.
+        """
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def __str__(self):
         return str(self.value)
 
@@ -19,17 +34,40 @@ class Name(Field):
     Class for storing contact name. Required field.
     """
 
-    pass
+    __slots__ = ()
+
+
+@lru_cache(maxsize=4096)
+def _validate_phone(value: str) -> int:
+    """
+    Checks that the phone number has exactly 10 digits.
+    Returns it packed into an int; use format_phone to display it.
+    Raises a ValueError otherwise.
+    Results are cached, since the same numbers tend to repeat within a session.
+    """
+    # Length first (cheapest), then ASCII so Unicode digits are rejected.
+    if len(value) != 10 or not (value.isascii() and value.isdigit()):
+        raise ValueError("Phone number must contain exactly 10 digits.")
+    return int(value)
+
+
+def format_phone(phone: int) -> str:
+    """
+    Formats a packed phone number back into its 10-digit string form.
+    """
+    return f"{phone:010d}"
 
 
 class Phone(Field):
     """
     Class for storing phone numbers. Has format validation (10 digits).
+    Records keep phones as packed ints; this class is the public validator.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
-        if not value.isdigit() or len(value) != 10:
-            raise ValueError("Phone number must contain exactly 10 digits.")
+        _validate_phone(value)
         super().__init__(value)
 
     def __eq__(self, other):
@@ -38,16 +76,34 @@ class Phone(Field):
         return False
 
 
+def format_date(value: date) -> str:
+    """
+    Formats a date as DD.MM.YYYY without going through strftime.
+    """
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
 class Birthday(Field):
     """
     Class for storing birthdays with validation.
+    Caches the (month, day) pair used for upcoming-birthday lookups.
     """
 
+    __slots__ = ("md",)
+
     def __init__(self, value):
         try:
             self.value = datetime.strptime(value, "%d.%m.%Y").date()
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        self.md = (self.value.month, self.value.day)
+
+    def __setstate__(self, state):
+        """
+        Restores the birthday, deriving (month, day) if the state lacks it.
+        """
+        super().__setstate__(state)
+        self.md = (self.value.month, self.value.day)
 
 
 class Record:
@@ -55,16 +111,61 @@ class Record:
     A class for storing contact information, including name, phones, and birthday.
     """
 
+    __slots__ = ("name", "_name_str", "phones", "_phone_set", "birthday", "_book")
+
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        self._name_str = name
+        self.phones: list[int] = []
+        self._phone_set: set[int] = set()
         self.birthday = None
+        self._book = None
+
+    def __reduce__(self):
+        """
+        Pickles the record as plain strings instead of nested field objects.
+        """
+        return (
+            _rebuild_record,
+            (
+                self._name_str,
+                self.phones,
+                self.birthday.value.isoformat() if self.birthday else None,
+            ),
+        )
+
+    def __setstate__(self, state):
+        """
+        Restores a record pickled by older versions as a plain attribute dict
+        with Name, Phone and Birthday objects, converting it to the current form.
+        """
+        self.name = state["name"]
+        self._name_str = self.name.value
+        self.phones = [
+            int(p.value) if isinstance(p, Phone) else p for p in state["phones"]
+        ]
+        self._phone_set = set(self.phones)
+        self.birthday = state.get("birthday")
+        self._book = None
+
+    def __copy__(self):
+        """
+        Copies the record with its own phone containers, detached from any book.
+        """
+        record = object.__new__(Record)
+        record.name = self.name
+        record._name_str = self._name_str
+        record.phones = list(self.phones)
+        record._phone_set = set(self._phone_set)
+        record.birthday = self.birthday
+        record._book = None
+        return record
 
     def __str__(self):
-        phones = "; ".join(p.value for p in self.phones)
-        result = f"Contact: {self.name}, Phones: {phones}"
+        phones = "; ".join(map(format_phone, self.phones))
+        result = f"Contact: {self._name_str}, Phones: {phones}"
         if self.birthday:
-            result += f", Birthday: {self.birthday.value.strftime('%d.%m.%Y')}"
+            result += f", Birthday: {format_date(self.birthday.value)}"
         return result
 
     def add_phone(self, phone_number):
@@ -72,71 +173,186 @@ class Record:
         Add a phone number to the contact.
         Raises a ValueError if the phone number already exists.
         """
-        phone = Phone(phone_number)
-        if phone in self.phones:
+        phone = _validate_phone(phone_number)
+        if phone in self._phone_set:
             raise ValueError(
-                f"Phone {phone_number} already exists in contact {self.name}."
+                f"Phone {phone_number} already exists in contact {self._name_str}."
             )
+        self._phone_set.add(phone)
         self.phones.append(phone)
+        if self._book is not None:
+            self._book._index_phone(phone, self)
 
     def remove_phone(self, phone_number):
         """
         Remove a phone number from the contact.
         Raises a ValueError if the phone number is not found.
         """
-        phone = Phone(phone_number)
-        if phone not in self.phones:
+        phone = _validate_phone(phone_number)
+        if phone not in self._phone_set:
             raise ValueError(
-                f"Phone {phone_number} has not been found in contact {self.name}."
+                f"Phone {phone_number} has not been found in contact {self._name_str}."
             )
+        self._phone_set.remove(phone)
         self.phones.remove(phone)
+        if self._book is not None:
+            self._book._unindex_phone(phone, self)
 
     def edit_phone(self, old_phone, new_phone):
         """
         Edit a phone number in the contact.
-        Raises a ValueError if the old phone number is not found.
+        Raises a ValueError if the old phone number is not found
+        or the new one already belongs to the contact.
         """
-        old_phone_obj = Phone(old_phone)
-        new_phone_obj = Phone(new_phone)
+        old = _validate_phone(old_phone)
+        new = _validate_phone(new_phone)
 
-        if old_phone_obj not in self.phones:
+        if old not in self._phone_set:
+            raise ValueError(
+                f"Phone {old_phone} has not been found in contact {self._name_str}."
+            )
+        if new != old and new in self._phone_set:
             raise ValueError(
-                f"Phone {old_phone} has not been found in contact {self.name}."
+                f"Phone {new_phone} already exists in contact {self._name_str}."
             )
 
-        index = self.phones.index(old_phone_obj)
-        self.phones[index] = new_phone_obj
+        index = self.phones.index(old)
+        self.phones[index] = new
+        self._phone_set.discard(old)
+        self._phone_set.add(new)
+        if self._book is not None:
+            self._book._unindex_phone(old, self)
+            self._book._index_phone(new, self)
 
     def find_phone(self, phone_number):
         """
         Find a phone number in the contact.
         """
-        phone = Phone(phone_number)
-        if phone in self.phones:
-            return phone
+        phone = _validate_phone(phone_number)
+        if phone in self._phone_set:
+            return format_phone(phone)
         return None
 
     def add_birthday(self, birthday):
         """
         Sets the birthday attribute by creating a new Birthday object.
         """
-        self.birthday = Birthday(birthday)
+        new_birthday = Birthday(birthday)
+        if self._book is not None:
+            self._book._unindex_birthday(self)
+        self.birthday = new_birthday
+        if self._book is not None:
+            self._book._index_birthday(self)
+
+
+def _new_field(cls, value):
+    """
+    Creates a field without running its validation (data is already valid).
+    """
+    field = object.__new__(cls)
+    field.value = value
+    return field
+
+
+def _rebuild_record(name, phones, birthday):
+    """
+    Restores a Record from the tuple produced by Record.__reduce__.
+    """
+    record = object.__new__(Record)
+    record.name = _new_field(Name, name)
+    record._name_str = name
+    record.phones = phones
+    record._phone_set = set(phones)
+    record._book = None
+    record.birthday = None
+    if birthday:
+        value = date.fromisoformat(birthday)
+        record.birthday = _new_field(Birthday, value)
+        record.birthday.md = (value.month, value.day)
+    return record
 
 
 class AddressBook(UserDict):
     """
     A class for storing and managing records.
+    Keeps reverse indexes from phone number to the records that own it
+    and from birthday (month, day) to the records born on that day.
     """
 
+    def __init__(self, *args, **kwargs):
+        self._by_phone: dict[int, list[Record]] = {}
+        self._by_birthday: dict[tuple[int, int], list[Record]] = {}
+        super().__init__(*args, **kwargs)
+
+    def __getstate__(self):
+        """
+        Pickles only the records; the indexes are derived and not stored.
+        """
+        return {"data": self.data}
+
+    def __setstate__(self, state):
+        """
+        Restores the records and rebuilds the indexes from them.
+        """
+        self.data = state["data"]
+        # Build the indexes in locals to keep attribute lookups out of the loops.
+        by_phone = {}
+        by_birthday = {}
+        for record in self.data.values():
+            record._book = self
+            for phone in record.phones:
+                by_phone.setdefault(phone, []).append(record)
+            if record.birthday:
+                by_birthday.setdefault(record.birthday.md, []).append(record)
+        self._by_phone = by_phone
+        self._by_birthday = by_birthday
+
+    def __setitem__(self, name: str, record: Record):
+        """
+        Stores the record under the name and keeps the indexes in sync.
+        A record already indexed elsewhere (another book, or this one under
+        a different name) is stored as a copy, since it tracks a single book.
+        """
+        old = self.data.get(name)
+        if record._book is not None and record is not old:
+            record = copy(record)
+        if old is not None:
+            self._unindex_record(old)
+        self.data[name] = record
+        self._index_record(record)
+
+    def __delitem__(self, name: str):
+        """
+        Removes the record stored under the name and drops it from the indexes.
+        """
+        self._unindex_record(self.data.pop(name))
+
+    def __copy__(self):
+        """
+        Copies the book together with its records, since each record
+        tracks the book that indexes it.
+        """
+        book = self.__class__.__new__(self.__class__)
+        book.__setstate__(
+            {"data": {name: copy(record) for name, record in self.data.items()}}
+        )
+        return book
+
+    def copy(self):
+        """
+        Returns a copy of the book with copied records and rebuilt indexes.
+        """
+        return self.__copy__()
+
     def add_record(self, record: Record):
         """
         Adds a new record to the address book.
         Raises a ValueError if a record with the same name already exists.
         """
-        name = str(record.name)
+        name = record._name_str
         if name in self.data:
             raise ValueError(f"Contact '{name}' already exists.")
-        self.data[name] = record
+        self[name] = record
         return f"Contact '{name}' has been added."
 
     def find(self, name: str):
@@ -157,34 +373,83 @@ class AddressBook(UserDict):
         Raises a KeyError if the contact does not exist.
         """
         if name in self.data:
-            del self.data[name]
+            del self[name]
             return f"Contact '{name}' has been successfully deleted."
         else:
             raise KeyError(f"Contact '{name}' not found.")
 
+    def find_by_phone(self, phone: str):
+        """
+        Searches for a contact that owns the given phone number.
+        Returns the earliest added owner's Record if found, otherwise None.
+        Raises a ValueError if the phone number format is invalid.
+        """
+        records = self._by_phone.get(_validate_phone(phone))
+        return records[0] if records else None
+
+    def _index_record(self, record: Record):
+        """
+        Attaches the record to the book and indexes its phones and birthday.
+        """
+        record._book = self
+        for phone in record.phones:
+            self._index_phone(phone, record)
+        self._index_birthday(record)
+
+    def _unindex_record(self, record: Record):
+        """
+        Detaches the record from the book and drops it from the indexes.
+        """
+        record._book = None
+        for phone in record.phones:
+            self._unindex_phone(phone, record)
+        self._unindex_birthday(record)
+
+    def _index_phone(self, phone: int, record: Record):
+        """
+        Adds the record to the owners of the phone.
+        """
+        self._by_phone.setdefault(phone, []).append(record)
+
+    def _unindex_phone(self, phone: int, record: Record):
+        """
+        Removes the record from the owners of the phone.
+        """
+        records = self._by_phone[phone]
+        records.remove(record)
+        if not records:
+            del self._by_phone[phone]
+
+    def _index_birthday(self, record: Record):
+        """
+        Adds the record under its birthday (month, day), if it has a birthday.
+        """
+        if record.birthday:
+            self._by_birthday.setdefault(record.birthday.md, []).append(record)
+
+    def _unindex_birthday(self, record: Record):
+        """
+        Removes the record from the birthday index, if it has a birthday.
+        """
+        if record.birthday:
+            records = self._by_birthday[record.birthday.md]
+            records.remove(record)
+            if not records:
+                del self._by_birthday[record.birthday.md]
+
     def get_upcoming_birthdays(self):
         """
         Returns a list of contacts who have birthdays within the next 7 days.
-        Raises a ValueError if a birthday date is invalid or improperly formatted.
+        A 29 February birthday only matches in years where that date exists.
         """
         today = datetime.today().date()
         upcoming_birthdays = []
+        append = upcoming_birthdays.append
+        by_birthday = self._by_birthday
 
-        for record in self.data.values():
-            if record.birthday:
-                try:
-                    birthday_this_year = record.birthday.value.replace(year=today.year)
-                    if birthday_this_year < today:
-                        birthday_this_year = birthday_this_year.replace(
-                            year=today.year + 1
-                        )
-                    if (birthday_this_year - today).days < 7:
-                        upcoming_birthdays.append(
-                            f"{record.name}: {birthday_this_year.strftime('%d.%m.%Y')}"
-                        )
-                except ValueError as e:
-                    raise ValueError(
-                        f"Invalid birthday for contact '{record.name}': {e}"
-                    )
+        for i in range(7):
+            day = today + timedelta(days=i)
+            for record in by_birthday.get((day.month, day.day), ()):
+                append(f"{record._name_str}: {format_date(day)}")
 
         return upcoming_birthdays
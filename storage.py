@@ -1,10 +1,21 @@
 import pickle
+
+try:
+    from _pickle import dump, load
+except ImportError:
+    from pickle import dump, load
+
 from models import AddressBook
 
+# Large buffer so pickle's many small writes/reads are batched into few syscalls.
+BUFFER_SIZE = 8 * 1024 * 1024
+
 
 def save_data(book, filename="addressbook.pkl"):
     """
     Saves the address book object to a file using the pickle module.
+    The object is streamed straight into a buffered file handle, so no
+    intermediate bytes copy of the whole pickle is built in memory.
 
     Args:
         book (AddressBook): The address book instance to be saved.
@@ -13,8 +24,8 @@ def save_data(book, filename="addressbook.pkl"):
     Returns:
         None
     """
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    with open(filename, "wb", buffering=BUFFER_SIZE) as f:
+        dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_data(filename="addressbook.pkl"):
@@ -29,7 +40,7 @@ def load_data(filename="addressbook.pkl"):
         AddressBook: The loaded address book object or a new one if the file is not found.
     """
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        with open(filename, "rb", buffering=BUFFER_SIZE) as f:
+            return load(f)
     except FileNotFoundError:
         return AddressBook()
@@ -0,0 +1,198 @@
+import base64
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from models import AddressBook, Record
+from storage import load_data, save_data
+
+# addressbook.pkl written by the original save_data (plain attribute dicts,
+# Name/Phone/Birthday objects): John 0501234567, 0509999999, 16.10.1990;
+# Ann 0670000000.
+LEGACY_PICKLE = base64.b64decode(
+    "gASVMwEAAAAAAACMBm1vZGVsc5SMC0FkZHJlc3NCb29rlJOUKYGUfZSMBGRhdGGUfZQojARK"
+    "b2hulGgAjAZSZWNvcmSUk5QpgZR9lCiMBG5hbWWUaACMBE5hbWWUk5QpgZR9lIwFdmFsdWWU"
+    "aAdzYowGcGhvbmVzlF2UKGgAjAVQaG9uZZSTlCmBlH2UaBGMCjA1MDEyMzQ1NjeUc2JoFSmB"
+    "lH2UaBGMCjA1MDk5OTk5OTmUc2JljAhiaXJ0aGRheZRoAIwIQmlydGhkYXmUk5QpgZR9lGgR"
+    "jAhkYXRldGltZZSMBGRhdGWUk5RDBAfGChCUhZRSlHNidWKMA0FubpRoCSmBlH2UKGgMaA4p"
+    "gZR9lGgRaCdzYmgSXZRoFSmBlH2UaBGMCjA2NzAwMDAwMDCUc2JhaBxOdWJ1c2Iu"
+)
+
+
+def make_record(name, *phones, birthday=None):
+    record = Record(name)
+    for phone in phones:
+        record.add_phone(phone)
+    if birthday:
+        record.add_birthday(birthday)
+    return record
+
+
+class IndexAssertions:
+    """
+    Provides a check that the book's indexes match its records.
+    """
+
+    def assertIndexesConsistent(self, book):
+        by_phone = {}
+        by_birthday = {}
+        for record in book.data.values():
+            self.assertIs(record._book, book)
+            self.assertEqual(record._phone_set, set(record.phones))
+            for phone in record.phones:
+                by_phone.setdefault(phone, []).append(id(record))
+            if record.birthday:
+                by_birthday.setdefault(record.birthday.md, []).append(id(record))
+
+        def ids(index):
+            return {key: sorted(map(id, records)) for key, records in index.items()}
+
+        self.assertEqual(
+            ids(book._by_phone), {k: sorted(v) for k, v in by_phone.items()}
+        )
+        self.assertEqual(
+            ids(book._by_birthday), {k: sorted(v) for k, v in by_birthday.items()}
+        )
+
+
+class AddressBookIndexTest(IndexAssertions, unittest.TestCase):
+    """
+    Checks that the phone and birthday indexes always match the records.
+    """
+
+    def setUp(self):
+        self.book = AddressBook()
+        self.book.add_record(make_record("Ann", "0501234567", birthday="16.10.1990"))
+        self.book.add_record(make_record("Bob", "0670000000"))
+
+    def test_phone_edits(self):
+        ann = self.book["Ann"]
+        ann.add_phone("0509999999")
+        ann.edit_phone("0501234567", "0501111111")
+        ann.remove_phone("0509999999")
+        self.assertIndexesConsistent(self.book)
+        self.assertIs(self.book.find_by_phone("0501111111"), ann)
+        self.assertIsNone(self.book.find_by_phone("0501234567"))
+        self.assertIsNone(self.book.find_by_phone("0509999999"))
+
+    def test_shared_number(self):
+        self.book.add_record(make_record("Cat", "0501234567"))
+        self.book.delete("Cat")
+        self.assertIs(self.book.find_by_phone("0501234567"), self.book["Ann"])
+        self.book.add_record(make_record("Dan", "0501234567"))
+        self.book.delete("Ann")
+        self.assertIs(self.book.find_by_phone("0501234567"), self.book["Dan"])
+        self.assertIndexesConsistent(self.book)
+
+    def test_birthday_change(self):
+        self.book["Ann"].add_birthday("01.01.1990")
+        self.book["Bob"].add_birthday("01.01.1985")
+        self.assertIndexesConsistent(self.book)
+        self.assertNotIn((10, 16), self.book._by_birthday)
+
+    def test_upcoming_birthdays(self):
+        day = date.today() + timedelta(days=3)
+        self.book["Bob"].add_birthday(f"{day.day:02d}.{day.month:02d}.1985")
+        self.assertIn(
+            f"Bob: {day.day:02d}.{day.month:02d}.{day.year}",
+            self.book.get_upcoming_birthdays(),
+        )
+
+    def test_dict_mutations(self):
+        ann = self.book["Ann"]
+        self.book["Cat"] = make_record("Cat", "0631234567", birthday="02.02.2002")
+        self.book.update({"Dan": make_record("Dan", "0931234567")})
+        self.book["Cat"] = make_record("Cat", "0632222222")
+        del self.book["Dan"]
+        self.book.pop("Bob")
+        self.book.delete("Ann")
+        self.assertIsNone(ann._book)
+        self.assertIndexesConsistent(self.book)
+        self.assertEqual(list(self.book), ["Cat"])
+        self.assertIsNone(self.book.find_by_phone("0631234567"))
+        self.assertIsNone(self.book.find_by_phone("0931234567"))
+
+        built = AddressBook({"Eve": make_record("Eve", "0441234567")})
+        self.assertIndexesConsistent(built)
+        self.assertIs(built.find_by_phone("0441234567"), built["Eve"])
+
+    def test_copy(self):
+        for other in (self.book.copy(), copy.copy(self.book), copy.deepcopy(self.book)):
+            other.add_record(make_record("Cat", "0631234567"))
+            other["Ann"].add_phone("0501111111")
+            self.assertIndexesConsistent(other)
+            self.assertIndexesConsistent(self.book)
+            self.assertNotIn("Cat", self.book)
+            self.assertIsNone(self.book.find_by_phone("0631234567"))
+            self.assertIsNone(self.book.find_by_phone("0501111111"))
+
+    def test_record_in_two_books(self):
+        snapshot = AddressBook(self.book)
+        merged = self.book | {"Cat": make_record("Cat")}
+        other = AddressBook()
+        other.update(self.book)
+        self.book["Ann"].add_phone("0123456789")
+        self.assertIs(self.book.find_by_phone("0123456789"), self.book["Ann"])
+        for book in (snapshot, merged, other):
+            self.assertIndexesConsistent(book)
+            self.assertIsNone(book.find_by_phone("0123456789"))
+        self.assertEqual(
+            self.book.delete("Ann"), "Contact 'Ann' has been successfully deleted."
+        )
+        self.assertIndexesConsistent(self.book)
+
+    def test_record_under_two_names(self):
+        self.book["Alias"] = self.book["Ann"]
+        self.assertIsNot(self.book["Alias"], self.book["Ann"])
+        del self.book["Alias"]
+        self.assertIs(self.book.find_by_phone("0501234567"), self.book["Ann"])
+        self.assertIndexesConsistent(self.book)
+
+    def test_pickle_roundtrip(self):
+        loaded = pickle.loads(pickle.dumps(self.book, pickle.HIGHEST_PROTOCOL))
+        self.assertIndexesConsistent(loaded)
+        self.assertEqual(
+            [str(r) for r in loaded.values()], [str(r) for r in self.book.values()]
+        )
+
+
+class LegacyPickleTest(IndexAssertions, unittest.TestCase):
+    """
+    Checks that address books saved by the original version still load.
+    """
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".pkl")
+        with os.fdopen(fd, "wb") as f:
+            f.write(LEGACY_PICKLE)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_load_and_use(self):
+        book = load_data(self.path)
+        self.assertIndexesConsistent(book)
+        self.assertEqual(
+            str(book["John"]),
+            "Contact: John, Phones: 0501234567; 0509999999, Birthday: 16.10.1990",
+        )
+        self.assertIs(book.find_by_phone("0670000000"), book["Ann"])
+
+        book["John"].add_phone("0507654321")
+        book["John"].edit_phone("0501234567", "0501111111")
+        book["Ann"].add_birthday("17.10.1985")
+        self.assertIndexesConsistent(book)
+
+        save_data(book, self.path)
+        reloaded = load_data(self.path)
+        self.assertIndexesConsistent(reloaded)
+        self.assertEqual(
+            [str(r) for r in reloaded.values()], [str(r) for r in book.values()]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,11 @@
+# Maps each handled exception type to a function building the error message.
+_ERROR_MESSAGES = {
+    ValueError: lambda e: f"ValueError: {e}",
+    KeyError: lambda e: "Error: contact not found.",
+    IndexError: lambda e: str(e) or "Error: missing arguments.",
+}
+
+
 def input_error(func):
     """
     A decorator to handle input-related exceptions such as ValueError, KeyError, and IndexError.
@@ -12,12 +20,11 @@ def input_error(func):
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ValueError as e:
-            return f"ValueError: {e}"
-        except KeyError:
-            return "Error: contact not found."
-        except IndexError as e:
-            return str(e) or "Error: missing arguments."
+        except (ValueError, KeyError, IndexError) as e:
+            # Exact type is a single lookup; the MRO walk covers subclasses.
+            for cls in type(e).__mro__:
+                if cls in _ERROR_MESSAGES:
+                    return _ERROR_MESSAGES[cls](e)
 
     return inner
 
@@ -32,5 +39,5 @@ def parse_input(user_input):
     Returns:
         tuple: A tuple containing the command (str) and a list of arguments (list).
     """
-    cmd, *args = user_input.strip().split()
-    return cmd.lower(), args
+    cmd, *rest = user_input.split(maxsplit=1) or [""]
+    return cmd.lower(), rest[0].split() if rest else []